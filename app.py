@@ -1,13 +1,11 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import folium
-from streamlit_folium import st_folium
+import streamlit.components.v1 as components
 from folium import plugins
-import random
-from math import radians, cos, sin, asin, sqrt
 from ortools.constraint_solver import routing_enums_pb2
 from ortools.constraint_solver import pywrapcp
-import datetime
 
 # --- PAGE CONFIG ---
 st.set_page_config(page_title="Supply Chain Control Tower V8.0", page_icon="🌍", layout="wide")
@@ -19,21 +17,87 @@ st.markdown("### Industrial Engineering Portfolio | Unicas")
 st.sidebar.header("Control Panel")
 mode = st.sidebar.radio("Select Mode:", ["📊 Network Monitoring (Digital Twin)", "🚚 AI Route Optimizer (VRP)"])
 
-# --- HELPER: HAVERSINE DISTANCE ---
-def haversine(lon1, lat1, lon2, lat2):
-    lon1, lat1, lon2, lat2 = map(radians, [lon1, lat1, lon2, lat2])
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * asin(sqrt(a))
-    r = 6371 
-    return c * r
+# --- SAFE ZONES (VRP depot centers and customer bounding boxes) ---
+CITY_ZONES = {
+    "Milan (Inland)":   {'center': (45.4642, 9.1900),  'bounds': [45.40, 45.55, 9.10, 9.30]},
+    "Naples (Coastal)": {'center': (40.8518, 14.2681), 'bounds': [40.86, 40.95, 14.20, 14.35]},
+    "Rome (Central)":   {'center': (41.9028, 12.4964), 'bounds': [41.80, 42.00, 12.40, 12.60]}
+}
 
-# --- MODE 1: MONITORING (RESTORED FEATURES) ---
-if mode == "📊 Network Monitoring (Digital Twin)":
-    st.info("Visualizing live inventory levels across the supply chain network.")
-    
-    # 1. Raw Data
+# --- HELPER: HAVERSINE DISTANCE MATRIX ---
+# Pairwise great-circle distances (meters) between all points. Points are mapped once to unit-sphere
+# vectors, so each pair only needs its chord length c and one arcsin (arc = 2 * asin(c / 2)).
+# The matrix is symmetric with a zero diagonal, so only upper-triangle pairs are evaluated and mirrored.
+def haversine_matrix(lats, lons):
+    lat = np.radians(np.asarray(lats))
+    lon = np.radians(np.asarray(lons))
+    cos_lat = np.cos(lat)
+    xyz = np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+    i, j = np.triu_indices(len(lat), 1)
+    chord = np.linalg.norm(xyz[i] - xyz[j], axis=1)
+    r = 6371000
+    matrix = np.zeros((len(lat), len(lat)), dtype=np.int32)
+    matrix[i, j] = matrix[j, i] = (2 * r * np.arcsin(chord / 2)).astype(np.int32)
+    return matrix
+
+# --- HELPER: SCENARIO GENERATOR (CACHED) ---
+# A fixed (depot city, stops, seed) always yields the same customers, so repeat runs also hit the matrix and solve caches
+@st.cache_data
+def generate_scenario(depot_city, num_locations, seed):
+    zone = CITY_ZONES[depot_city]
+    bounds = zone['bounds']
+    rng = np.random.default_rng(seed)
+    points = rng.uniform([bounds[0], bounds[2]], [bounds[1], bounds[3]], size=(num_locations, 2))
+    coords = np.vstack([zone['center'], points])
+    names = ['Central Depot'] + [f'Customer #{i+1}' for i in range(num_locations)]
+    return coords, names
+
+# --- HELPER: DISTANCE MATRIX (CACHED) ---
+# coords is an (N, 2) array of (lat, lon) rows; Streamlit hashes its contents as the cache key
+@st.cache_data
+def build_matrix(coords):
+    return haversine_matrix(coords[:, 0], coords[:, 1])
+
+# --- HELPER: VRP SOLVER (CACHED) ---
+# Returns the node sequence (depot -> ... -> depot) of every vehicle, or None if no solution
+@st.cache_data
+def solve_vrp(matrix, num_vehicles, depot=0):
+    manager = pywrapcp.RoutingIndexManager(len(matrix), num_vehicles, depot)
+    model_parameters = pywrapcp.DefaultRoutingModelParameters()
+    model_parameters.max_callback_cache_size = len(matrix) ** 2
+    model_parameters.reduce_vehicle_cost_model = True  # all trucks share the same arc cost
+    routing = pywrapcp.RoutingModel(manager, model_parameters)
+
+    # The matrix is copied into the C++ solver once, so no Python callback runs during search
+    transit_callback_index = routing.RegisterTransitMatrix(matrix.tolist())
+    routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
+
+    dimension_name = 'Distance'
+    routing.AddDimension(transit_callback_index, 0, 300000, True, dimension_name)
+    distance_dimension = routing.GetDimensionOrDie(dimension_name)
+    distance_dimension.SetGlobalSpanCostCoefficient(100)
+
+    search_parameters = pywrapcp.DefaultRoutingSearchParameters()
+    search_parameters.first_solution_strategy = (routing_enums_pb2.FirstSolutionStrategy.PARALLEL_CHEAPEST_INSERTION)
+    search_parameters.local_search_metaheuristic = (routing_enums_pb2.LocalSearchMetaheuristic.GUIDED_LOCAL_SEARCH)
+    search_parameters.time_limit.seconds = 2
+    solution = routing.SolveWithParameters(search_parameters)
+    if not solution:
+        return None
+
+    vehicle_nodes = []
+    for vehicle_id in range(num_vehicles):
+        index = routing.Start(vehicle_id)
+        nodes = [manager.IndexToNode(index)]
+        while not routing.IsEnd(index):
+            index = solution.Value(routing.NextVar(index))
+            nodes.append(manager.IndexToNode(index))
+        vehicle_nodes.append(nodes)
+    return vehicle_nodes
+
+# --- HELPER: MONITORING DATA (CACHED) ---
+@st.cache_data
+def load_monitoring_df():
     data = {
         'ID': [101, 102, 103, 104, 105],
         'Location': ['Factory Rome', 'DC Milan', 'Warehouse Naples', 'Supplier Turin', 'Port Genoa'],
@@ -44,7 +108,129 @@ if mode == "📊 Network Monitoring (Digital Twin)":
         'Capacity': [5000, 10000, 5000, 0, 20000],
         'Status': ['Normal', 'Critical', 'Normal', 'Normal', 'Risk']
     }
-    df = pd.DataFrame(data)
+    return pd.DataFrame(data)
+
+# --- HELPER: MONITORING MAP (CACHED) ---
+# The map only depends on the facility-type filter, so the tuple of selected types is the cache key.
+# The rendered HTML is cached, so reruns skip both the marker build and the Jinja render.
+@st.cache_data
+def build_monitoring_map_html(selected_types):
+    df = load_monitoring_df()
+    df_filtered = df[df['Type'].isin(selected_types)]
+
+    m = folium.Map(location=[42.5, 12.5], zoom_start=6)
+    facilities_layer = folium.FeatureGroup(name="Facilities")
+    
+    colors = np.where(df_filtered['Status'].isin({'Critical', 'Risk'}), 'red', 'green')
+    for loc, typ, lat, lon, inv, cap, status, color in zip(df_filtered['Location'], df_filtered['Type'], df_filtered['Lat'], df_filtered['Lon'],
+                                                          df_filtered['Inventory'], df_filtered['Capacity'], df_filtered['Status'], colors):
+        # Detailed Popup
+        popup_html = f"""
+        <b>{loc}</b><br>
+        Type: {typ}<br>
+        📦 Stock: {inv} / {cap}<br>
+        ⚠️ Status: {status}
+        """
+        
+        folium.CircleMarker(
+            [lat, lon], radius=8, color=color, fill=True, fill_opacity=0.9,
+            popup=folium.Popup(popup_html, max_width=200),
+            tooltip=f"{loc} ({status})"
+        ).add_to(facilities_layer)
+    
+    facilities_layer.add_to(m)
+    return m.get_root().render()
+
+# --- VRP DYNAMIC RENDERER (FRAGMENT) ---
+# Moving the traffic slider reruns only this fragment; the cached scenario and solve stay untouched
+@st.fragment
+def render_vrp_dynamic(vrp_data, base_speed):
+    traffic_intensity = st.slider("🚦 Traffic Intensity (Slows down operations)", 0, 90, 20, format="%d%%")
+    
+    effective_speed = base_speed * (1 - (traffic_intensity / 100))
+    st.caption(f"ℹ️ Effective Average Speed: **{effective_speed:.1f} km/h**")
+
+    if not vrp_data:
+        return
+
+    st.caption(f"🎲 Scenario seed: **{vrp_data['seed']}** (enter it in the sidebar to replay this scenario)")
+    m2 = folium.Map(location=vrp_data["center"], zoom_start=11)
+    
+    total_fleet_km = 0
+    total_fleet_hours = 0
+    fleet_itinerary = []
+    start_min = 8 * 60
+    
+    for route in vrp_data["raw_routes"]:
+        route_coords = route["coords"].tolist()
+        dists_km = route["dist_m"] / 1000
+        route_km = float(dists_km.sum())
+        service_min = 15
+        cum_min = np.cumsum(dists_km / max(effective_speed, 1) * 60 + service_min)
+        eta_min = cum_min.astype(np.int64) + start_min
+        truck_schedule = []
+        truck_layer = folium.FeatureGroup(name=f"Truck {route['vehicle_id']}")
+        
+        for end_coords, end_name, dist_km, eta in zip(route_coords[1:], route["names"], dists_km, eta_min.tolist()):
+            if "Depot" in end_name:
+                continue
+            eta_str = f"{eta // 60 % 24:02d}:{eta % 60:02d}"
+            truck_schedule.append({"Stop": end_name, "ETA": eta_str, "Distance (km)": f"{dist_km:.1f}"})
+
+            popup_html = f"""
+            <div style='font-family: sans-serif; width: 150px;'>
+                <b>{end_name}</b><br>
+                🚚 Truck: {route['vehicle_id']}<br>
+                ⏱️ ETA: <b>{eta_str}</b><br>
+                📏 Dist: {dist_km:.1f} km
+            </div>
+            """
+            folium.CircleMarker(
+                end_coords, radius=7, color=route["color"], fill=True, fill_opacity=1,
+                popup=folium.Popup(popup_html, max_width=200),
+                tooltip=f"{end_name} (ETA: {eta_str})"
+            ).add_to(truck_layer)
+        
+        plugins.AntPath(route_coords, color=route["color"], weight=5, delay=800, dash_array=[10, 20], pulse_color='white', opacity=1).add_to(truck_layer)
+        truck_layer.add_to(m2)
+        
+        total_fleet_km += route_km
+        hours = float(cum_min[-1]) / 60
+        total_fleet_hours += hours
+        
+        fleet_itinerary.append({
+            "id": route["vehicle_id"], "color": route["color"], "total_km": route_km,
+            "total_time": hours, "stops": truck_schedule
+        })
+
+    folium.Marker(vrp_data["center"], popup="DEPOT (Start 08:00)", icon=folium.Icon(color='black', icon='home')).add_to(m2)
+
+    # One-way HTML embed: the VRP map doesn't read click data either
+    components.html(m2.get_root().render(), width=1000, height=600)
+
+    # --- KPIs ---
+    st.markdown("### 🚦 Operational Metrics")
+    k1, k2, k3, k4 = st.columns(4)
+    k1.metric("Effective Speed", f"{effective_speed:.1f} km/h", delta=f"-{traffic_intensity}% Traffic", delta_color="inverse")
+    k2.metric("Total Fleet Dist.", f"{total_fleet_km:.1f} km")
+    k3.metric("Fleet Working Hours", f"{total_fleet_hours:.1f} hrs")
+    k4.metric("Est. Fuel Cost", f"€ {total_fleet_km * 0.45:.2f}")
+
+    # --- TABLES ---
+    st.markdown("### 📋 Detailed Driver Itineraries")
+    for truck in fleet_itinerary:
+        with st.expander(f"🚛 Truck {truck['id']} | Distance: {truck['total_km']:.1f} km | Time: {truck['total_time']:.1f} hrs", expanded=False):
+            if truck["stops"]:
+                st.dataframe(pd.DataFrame(truck["stops"]), use_container_width=True)
+            else:
+                st.warning("No stops assigned.")
+
+# --- MODE 1: MONITORING (RESTORED FEATURES) ---
+if mode == "📊 Network Monitoring (Digital Twin)":
+    st.info("Visualizing live inventory levels across the supply chain network.")
+    
+    # 1. Raw Data
+    df = load_monitoring_df()
 
     # 2. Filters (Restored)
     st.sidebar.markdown("---")
@@ -66,30 +252,8 @@ if mode == "📊 Network Monitoring (Digital Twin)":
     col4.metric("Avg Utilization", f"{(df_filtered['Inventory'].sum() / max(df_filtered['Capacity'].sum(), 1) * 100):.1f}%")
 
     # 4. Map
-    m = folium.Map(location=[42.5, 12.5], zoom_start=6)
-    
-    for index, row in df_filtered.iterrows():
-        color = 'red' if row['Status'] in ['Critical', 'Risk'] else 'green'
-        icon_map = {'Plant': 'industry', 'DC': 'building', 'Warehouse': 'cubes', 'Supplier': 'truck', 'Port': 'ship'}
-        icon = icon_map.get(row['Type'], 'info-sign')
-        
-        # Detailed Popup
-        popup_html = f"""
-        <b>{row['Location']}</b><br>
-        Type: {row['Type']}<br>
-        📦 Stock: {row['Inventory']} / {row['Capacity']}<br>
-        ⚠️ Status: {row['Status']}
-        """
-        
-        folium.Marker(
-            [row['Lat'], row['Lon']],
-            popup=folium.Popup(popup_html, max_width=200),
-            tooltip=f"{row['Location']} ({row['Status']})",
-            icon=folium.Icon(color=color, icon=icon, prefix='fa')
-        ).add_to(m)
-    
-    # FIX: returned_objects=[] prevents refresh loop on click
-    st_folium(m, width=1000, height=500, returned_objects=[])
+    # One-way HTML embed: no click/zoom state is sent back, so no refresh loop on click
+    components.html(build_monitoring_map_html(tuple(selected_types)), width=1000, height=500)
 
     # 5. Data Table (Restored)
     st.markdown("### 📋 Facility Details")
@@ -106,170 +270,47 @@ elif mode == "🚚 AI Route Optimizer (VRP)":
     num_vehicles = col1.slider("🚚 Vehicles", 2, 5, 3)
     num_locations = col2.slider("📍 Stops", 5, 30, 15)
     base_speed = col3.number_input("⚡ Max Speed (km/h)", value=60) 
-    depot_city = col4.selectbox("🏢 Depot City", ["Milan (Inland)", "Naples (Coastal)", "Rome (Central)"])
+    depot_city = col4.selectbox("🏢 Depot City", list(CITY_ZONES))
 
-    traffic_intensity = st.slider("🚦 Traffic Intensity (Slows down operations)", 0, 90, 20, format="%d%%")
-    
-    effective_speed = base_speed * (1 - (traffic_intensity / 100))
-    st.caption(f"ℹ️ Effective Average Speed: **{effective_speed:.1f} km/h**")
+    st.sidebar.markdown("---")
+    st.sidebar.subheader("🎲 Scenario")
+    scenario_seed = st.sidebar.number_input("Seed (0 = random each run)", min_value=0, value=0, step=1)
 
-    # SAFE ZONES
-    city_zones = {
-        "Milan (Inland)":   {'center': (45.4642, 9.1900),  'bounds': [45.40, 45.55, 9.10, 9.30]},
-        "Naples (Coastal)": {'center': (40.8518, 14.2681), 'bounds': [40.86, 40.95, 14.20, 14.35]},
-        "Rome (Central)":   {'center': (41.9028, 12.4964), 'bounds': [41.80, 42.00, 12.40, 12.60]}
-    }
-    selected_zone = city_zones[depot_city]
+    selected_zone = CITY_ZONES[depot_city]
     depot_lat, depot_lon = selected_zone['center']
 
-    if 'vrp_data_v8' not in st.session_state:
-        st.session_state.vrp_data_v8 = None
+    if 'vrp_data_v9' not in st.session_state:
+        st.session_state.vrp_data_v9 = None
 
     # --- BUTTON: GENERATE & SOLVE ---
     if st.button("🚀 Generate Scenario & Optimize"):
         
-        locations = [{'id': 0, 'lat': depot_lat, 'lon': depot_lon, 'name': 'Central Depot'}]
-        bounds = selected_zone['bounds']
-        for i in range(num_locations):
-            lat = random.uniform(bounds[0], bounds[1])
-            lon = random.uniform(bounds[2], bounds[3])
-            locations.append({'id': i+1, 'lat': lat, 'lon': lon, 'name': f'Customer #{i+1}'})
+        seed = scenario_seed or int(np.random.default_rng().integers(1, 2**31))
+        coords, names = generate_scenario(depot_city, num_locations, seed)
         
-        dist_matrix = {}
-        for i in range(len(locations)):
-            dist_matrix[i] = {}
-            for j in range(len(locations)):
-                dist = haversine(locations[i]['lon'], locations[i]['lat'], 
-                                 locations[j]['lon'], locations[j]['lat'])
-                dist_matrix[i][j] = int(dist * 1000)
-
-        manager = pywrapcp.RoutingIndexManager(len(locations), num_vehicles, 0)
-        routing = pywrapcp.RoutingModel(manager)
-
-        def distance_callback(from_index, to_index):
-            return dist_matrix[manager.IndexToNode(from_index)][manager.IndexToNode(to_index)]
-
-        transit_callback_index = routing.RegisterTransitCallback(distance_callback)
-        routing.SetArcCostEvaluatorOfAllVehicles(transit_callback_index)
-        
-        dimension_name = 'Distance'
-        routing.AddDimension(transit_callback_index, 0, 300000, True, dimension_name)
-        distance_dimension = routing.GetDimensionOrDie(dimension_name)
-        distance_dimension.SetGlobalSpanCostCoefficient(100) 
-
-        search_parameters = pywrapcp.DefaultRoutingSearchParameters()
-        search_parameters.first_solution_strategy = (routing_enums_pb2.FirstSolutionStrategy.PATH_CHEAPEST_ARC)
-        solution = routing.SolveWithParameters(search_parameters)
+        dist_matrix = build_matrix(coords)
+        vehicle_nodes = solve_vrp(dist_matrix, num_vehicles)
 
-        if solution:
+        if vehicle_nodes:
             raw_routes = []
             colors = ['red', 'blue', 'green', 'orange', 'purple']
             
-            for vehicle_id in range(num_vehicles):
-                index = routing.Start(vehicle_id)
-                route_legs = [] 
+            for vehicle_id, nodes in enumerate(vehicle_nodes):
+                # Per-route SoA: stop coordinates (depot first), leg distances and leg-end names
+                dist_m = dist_matrix[nodes[:-1], nodes[1:]]
                 
-                while not routing.IsEnd(index):
-                    node_index = manager.IndexToNode(index)
-                    start_loc = locations[node_index]
-                    previous_index = index
-                    index = solution.Value(routing.NextVar(index))
-                    next_node_index = manager.IndexToNode(index)
-                    end_loc = locations[next_node_index]
-                    dist_m = dist_matrix[node_index][next_node_index]
-                    
-                    route_legs.append({
-                        "start_coords": [start_loc['lat'], start_loc['lon']],
-                        "end_coords": [end_loc['lat'], end_loc['lon']],
-                        "end_name": end_loc['name'],
-                        "dist_m": dist_m
+                if dist_m.sum() > 0:
+                    raw_routes.append({
+                        "vehicle_id": vehicle_id + 1,
+                        "color": colors[vehicle_id % len(colors)],
+                        "coords": coords[nodes].astype(np.float32),
+                        "dist_m": dist_m.astype(np.int32),
+                        "names": [names[n] for n in nodes[1:]]
                     })
-                
-                if len(route_legs) > 0:
-                    if sum([leg['dist_m'] for leg in route_legs]) > 0:
-                        raw_routes.append({
-                            "vehicle_id": vehicle_id + 1,
-                            "color": colors[vehicle_id % len(colors)],
-                            "legs": route_legs
-                        })
             
-            st.session_state.vrp_data_v8 = {"center": [depot_lat, depot_lon], "raw_routes": raw_routes}
+            st.session_state.vrp_data_v9 = {"center": [depot_lat, depot_lon], "seed": seed, "raw_routes": raw_routes}
         else:
             st.error("Optimization Failed. Try again.")
 
     # --- DYNAMIC RENDERER ---
-    if st.session_state.vrp_data_v8:
-        data = st.session_state.vrp_data_v8
-        m2 = folium.Map(location=data["center"], zoom_start=11)
-        
-        total_fleet_km = 0
-        total_fleet_hours = 0
-        fleet_itinerary = []
-        current_time_base = datetime.datetime.now().replace(hour=8, minute=0, second=0)
-        
-        for route in data["raw_routes"]:
-            vehicle_time = current_time_base
-            route_coords = [[data["center"][0], data["center"][1]]] 
-            route_km = 0
-            truck_schedule = []
-            
-            for leg in route["legs"]:
-                travel_min = (leg["dist_m"] / 1000) / max(effective_speed, 1) * 60 
-                service_min = 15 
-                vehicle_time += datetime.timedelta(minutes=travel_min + service_min)
-                eta_str = vehicle_time.strftime("%H:%M")
-                
-                route_coords.append(leg["end_coords"])
-                route_km += leg["dist_m"] / 1000
-                
-                if "Depot" not in leg["end_name"]:
-                    truck_schedule.append({"Stop": leg["end_name"], "ETA": eta_str, "Distance (km)": f"{leg['dist_m']/1000:.1f}"})
-
-                if "Depot" not in leg["end_name"]:
-                    popup_html = f"""
-                    <div style='font-family: sans-serif; width: 150px;'>
-                        <b>{leg['end_name']}</b><br>
-                        🚚 Truck: {route['vehicle_id']}<br>
-                        ⏱️ ETA: <b>{eta_str}</b><br>
-                        📏 Dist: {leg['dist_m']/1000:.1f} km
-                    </div>
-                    """
-                    folium.CircleMarker(
-                        leg["end_coords"], radius=7, color=route["color"], fill=True, fill_opacity=1,
-                        popup=folium.Popup(popup_html, max_width=200),
-                        tooltip=f"{leg['end_name']} (ETA: {eta_str})"
-                    ).add_to(m2)
-            
-            folium.PolyLine(route_coords, color=route["color"], weight=4, opacity=0.5).add_to(m2)
-            plugins.AntPath(route_coords, color=route["color"], weight=4, delay=800, dash_array=[10, 20], pulse_color='white', opacity=1).add_to(m2)
-            
-            total_fleet_km += route_km
-            hours = (vehicle_time - current_time_base).total_seconds() / 3600
-            total_fleet_hours += hours
-            
-            fleet_itinerary.append({
-                "id": route["vehicle_id"], "color": route["color"], "total_km": route_km,
-                "total_time": hours, "stops": truck_schedule
-            })
-
-        folium.Marker(data["center"], popup="DEPOT (Start 08:00)", icon=folium.Icon(color='black', icon='home')).add_to(m2)
-
-        # FIX: returned_objects=[] prevents refresh loop on click for VRP map too
-        st_folium(m2, width=1000, height=600, returned_objects=[])
-
-        # --- KPIs ---
-        st.markdown("### 🚦 Operational Metrics")
-        k1, k2, k3, k4 = st.columns(4)
-        k1.metric("Effective Speed", f"{effective_speed:.1f} km/h", delta=f"-{traffic_intensity}% Traffic", delta_color="inverse")
-        k2.metric("Total Fleet Dist.", f"{total_fleet_km:.1f} km")
-        k3.metric("Fleet Working Hours", f"{total_fleet_hours:.1f} hrs")
-        k4.metric("Est. Fuel Cost", f"€ {total_fleet_km * 0.45:.2f}")
-
-        # --- TABLES ---
-        st.markdown("### 📋 Detailed Driver Itineraries")
-        for truck in fleet_itinerary:
-            with st.expander(f"🚛 Truck {truck['id']} | Distance: {truck['total_km']:.1f} km | Time: {truck['total_time']:.1f} hrs", expanded=False):
-                if truck["stops"]:
-                    st.dataframe(pd.DataFrame(truck["stops"]), use_container_width=True)
-                else:
-                    st.warning("No stops assigned.")
\ No newline at end of file
+    render_vrp_dynamic(st.session_state.vrp_data_v9, base_speed)